@@ -1,4 +1,7 @@
-from typing import Any, Sequence
+from typing import Any, FrozenSet, Sequence
+
+from sqlalchemy import inspect
+from sqlalchemy.orm.attributes import set_committed_value
 
 from .session import ScopedSessionHandler
 from .builders.select import SelectBuilder
@@ -9,6 +12,23 @@ from .builders.complex import WhereBuilder, ValuesBuilder
 class ActiveRecord(ScopedSessionHandler):
     __primary_key__: str = "id"
 
+    __all_column_keys__: FrozenSet[str] = frozenset()
+
+    __column_names__: FrozenSet[str] = frozenset()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        # declarative maps the class in super(), Mapper.columns is ready here
+        # without configuring the relationships of other mappers
+        mapper = getattr(cls, "__mapper__", None)
+
+        if mapper is not None:
+            cls.__all_column_keys__ = frozenset(mapper.columns.keys())
+            cls.__column_names__ = frozenset(
+                column.name for column in mapper.columns.values()
+            )
+
     @classmethod
     def select(cls, *entities):
         return cls()._new_select().select(*entities)
@@ -35,6 +55,10 @@ class ActiveRecord(ScopedSessionHandler):
     def order_by(cls, *express):
         return cls()._new_select().order_by(*express)
 
+    @classmethod
+    def with_relations(cls, *relations):
+        return cls()._new_select().with_relations(*relations)
+
     @classmethod
     def offset(cls, offset: int = 0):
         if not isinstance(offset, int):
@@ -55,12 +79,64 @@ class ActiveRecord(ScopedSessionHandler):
 
     @classmethod
     def create(cls, **attributes):
-        instance = cls(**attributes)
+        if not cls._can_insert_returning(attributes):
+            instance = cls(**attributes)
 
-        instance.save()
+            instance.save()
+
+            return instance
+
+        try:
+            # INSERT ... RETURNING loads the persisted row in a single round trip
+            instance = (
+                cls.values(attributes).returning(cls).insert(autocommit=False)
+            ).scalar_one()
+
+            loaded = {
+                key: value
+                for key, value in instance.__dict__.items()
+                if key in cls.__all_column_keys__
+            }
+
+            cls._session.commit()
+
+            # the returned row is what got committed, keep it instead of expiring
+            for key, value in loaded.items():
+                set_committed_value(instance, key, value)
+
+        except Exception as e:
+            cls._session.rollback()
+            raise e
 
         return instance
 
+    @classmethod
+    def _can_insert_returning(cls, attributes: dict) -> bool:
+        mapper = inspect(cls)
+        manager = mapper.class_manager
+
+        # bulk INSERT skips the constructor, init / insert / flush events and
+        # @validates, any of them falls back to save()
+        if (
+            manager.original_init is not mapper.registry.constructor
+            or any(
+                # the mapper registers its own init hook, ignore that one
+                listener.__module__ != "sqlalchemy.orm.mapper"
+                for listener in manager.dispatch.init
+            )
+            or mapper.dispatch.before_insert
+            or mapper.dispatch.after_insert
+            or mapper.validators
+            or cls._session().dispatch.before_flush
+        ):
+            return False
+
+        return (
+            bool(attributes)
+            and attributes.keys() <= cls.__all_column_keys__
+            and cls._session.get_bind().dialect.insert_returning
+        )
+
     @classmethod
     def values(cls, *args, **kwargs):
         return cls()._new_values().values(*args, **kwargs)
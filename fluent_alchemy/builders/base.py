@@ -1,14 +1,18 @@
-from typing import Optional, Generic, Callable
+from typing import Any, Optional, Generic, Callable, Union
 
-from sqlalchemy.orm import Session
-from sqlalchemy.sql.elements import BinaryExpression
+from sqlalchemy import bindparam
+from sqlalchemy.orm import Session, scoped_session
+from sqlalchemy.sql.elements import BinaryExpression, ColumnElement
 
 from . import _M
 
 
 class BaseBuilder(Generic[_M]):
-    def __init__(self, session: Session, model: _M):
-        self._session: Session = session
+    def __init__(self, session: Union[Session, scoped_session], model: _M):
+        # resolve the thread-local session once for the builder's lifetime
+        self._session: Session = (
+            session() if isinstance(session, scoped_session) else session
+        )
         self._model: _M = model
 
         self._scopes = {}
@@ -44,6 +48,11 @@ class WhereBase(BaseBuilder):
 
         return self
 
+    def where_eq(self, column: ColumnElement, value: Any):
+        # value is always a named bound parameter, so the compiled SQL is shared
+        # by every value; unique=True keeps repeated columns from colliding
+        return self.where(column == bindparam(column.key, value, unique=True))
+
 
 class ValueBase(BaseBuilder):
     _values = None
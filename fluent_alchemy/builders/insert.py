@@ -1,4 +1,4 @@
-from typing import Any
+from typing import Any, Mapping
 
 from sqlalchemy import Insert, insert
 from sqlalchemy.engine.result import Result
@@ -22,12 +22,21 @@ class InsertBuilder(ValueBase):
         if not self._values:
             raise ValueError("Values cannot be empty.")
 
-        self._insert_stmt = self._insert_stmt.values(self._values)
-
         if self._returning:
             self._insert_stmt = self._insert_stmt.returning(*self._returning)
 
-        result = self._session.execute(self._insert_stmt, *args, **kwargs)
+        if isinstance(self._values, list) and all(
+            isinstance(row, Mapping) for row in self._values
+        ):
+            # executemany keeps one cached statement whatever the row count,
+            # a multi VALUES clause compiles a new statement per row count
+            result = self._session.execute(
+                self._insert_stmt, self._values, *args, **kwargs
+            )
+        else:
+            self._insert_stmt = self._insert_stmt.values(self._values)
+
+            result = self._session.execute(self._insert_stmt, *args, **kwargs)
 
         if autocommit:
             self._commit()
@@ -1,10 +1,11 @@
 import math
 
-from typing import Any, Optional, Iterable
+from typing import Any, Iterator, Optional, Sequence, Union
 
 from sqlalchemy import select, func, Executable
 from sqlalchemy.sql.elements import BinaryExpression, UnaryExpression
 from sqlalchemy.engine.result import Result
+from sqlalchemy.orm import selectinload
 from sqlalchemy.orm.strategy_options import Load
 from sqlalchemy.sql import Select
 
@@ -13,6 +14,7 @@ from .base import WhereBase
 
 
 class SelectBuilder(WhereBase):
+    _stream_batch_size: int = 100
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -49,6 +51,13 @@ class SelectBuilder(WhereBase):
 
         return self
 
+    def distinct(self, *express):
+        self._select_stmt_init()
+
+        self._select_stmt = self._select_stmt.distinct(*express)
+
+        return self
+
     def group_by(self, *entities):
         self._select_stmt_init()
 
@@ -77,19 +86,38 @@ class SelectBuilder(WhereBase):
 
         return self
 
+    def with_relations(self, *relations):
+        model_class = self.get_model_class()
+
+        return self.options(
+            *(
+                selectinload(
+                    getattr(model_class, relation)
+                    if isinstance(relation, str)
+                    else relation
+                )
+                for relation in relations
+            )
+        )
+
+    def _build_stmt(self) -> Select:
+        self._select_stmt_init()
+
+        stmt = self._select_stmt
+
+        if self._where_clauses:
+            stmt = stmt.where(*self._where_clauses)
+
+        return stmt
+
     def execute(
         self, stmt: Optional[Executable] = None, *args, **kwargs
     ) -> Result[Any]:
-        stmt = stmt if stmt is not None else self._select_stmt
+        stmt = stmt if stmt is not None else self._build_stmt()
 
         return self._session.execute(stmt, *args, **kwargs)
 
     def first(self, specific_fields: bool = False) -> Optional[_M]:
-        self._select_stmt_init()
-
-        if self._where_clauses:
-            self._select_stmt = self._select_stmt.where(*self._where_clauses)
-
         result = self.execute()
 
         if specific_fields:
@@ -97,36 +125,55 @@ class SelectBuilder(WhereBase):
 
         return result.scalars().first()
 
-    def get(self, specific_fields: bool = False) -> Iterable[_M]:
-        self._select_stmt_init()
+    def get(
+        self, specific_fields: bool = False, stream: bool = False
+    ) -> Union[Sequence[_M], Iterator[Sequence[_M]]]:
+        if not stream:
+            result = self.execute()
 
-        if self._where_clauses:
-            self._select_stmt = self._select_stmt.where(*self._where_clauses)
+            return result.all() if specific_fields else result.scalars().all()
 
-        result = self.execute()
+        # yields lists of up to _stream_batch_size rows, the partitions must be
+        # consumed before another statement runs on the same session
+        result = self.execute(
+            execution_options={"yield_per": self._stream_batch_size}
+        )
 
         if specific_fields:
-            return result.all()
+            return result.partitions()
 
-        return result.scalars().all()
+        return result.scalars().partitions()
+
+    def _count(self, stmt: Select) -> int:
+        total_stmt = select(func.count()).select_from(self.get_model_class())
+        if stmt.whereclause is not None:
+            total_stmt = total_stmt.where(stmt.whereclause)
+
+        return self.execute(total_stmt).scalars().first()
 
     def paginate(self, page: int = 1, per_page: int = 30) -> dict:
         self.offset((page - 1) * per_page)
         self.limit(per_page)
 
-        if self._where_clauses:
-            self._select_stmt = self._select_stmt.where(*self._where_clauses)
+        stmt = self._build_stmt()
 
-        total_stmt = select(func.count()).select_from(self.get_model_class())
-        if self._select_stmt.whereclause is not None:
-            total_stmt = total_stmt.where(self._select_stmt.whereclause)
+        if stmt._distinct or stmt._group_by_clauses:
+            total_rows = self._count(stmt)
+            data = self.execute(stmt).scalars().all()
+        else:
+            # window function counts rows before LIMIT / OFFSET are applied
+            rows = self.execute(
+                stmt.add_columns(func.count().over().label("__total__"))
+            ).all()
 
-        total_rows = self.execute(total_stmt).scalars().first()
+            # an empty page carries no total, fall back to a count query
+            total_rows = rows[0][-1] if rows else self._count(stmt)
+            data = [row[0] for row in rows]
 
         return {
             "total": total_rows,
             "per_page": per_page,
             "current_page": page,
             "last_page": math.ceil(total_rows / per_page),
-            "data": self.get(),
+            "data": data,
         }
@@ -0,0 +1,63 @@
+import os
+import warnings
+import traceback
+
+from typing import Optional
+
+import sqlalchemy
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session, ORMExecuteState
+
+# trailing separator, so sibling packages such as sqlalchemy_utils don't match
+_INTERNALS = (
+    os.path.join(os.path.dirname(sqlalchemy.__file__), ""),
+    os.path.join(os.path.dirname(__file__), ""),
+)
+
+
+class LazyLoadWarning(UserWarning):
+    pass
+
+
+def _caller_frame() -> Optional[traceback.FrameSummary]:
+    for frame in reversed(traceback.extract_stack()):
+        if not frame.filename.startswith(_INTERNALS):
+            return frame
+
+    return None
+
+
+def _warn_lazy_load(orm_execute_state: ORMExecuteState):
+    if (
+        not orm_execute_state.is_select
+        or orm_execute_state.lazy_loaded_from is None
+    ):
+        return
+
+    message = (
+        f"Lazy load of {orm_execute_state.loader_strategy_path.prop}, "
+        "consider with_relations() to avoid N+1 queries"
+    )
+
+    frame = _caller_frame()
+
+    if frame is None:
+        warnings.warn(message, LazyLoadWarning, stacklevel=2)
+        return
+
+    warnings.warn_explicit(message, LazyLoadWarning, frame.filename, frame.lineno)
+
+
+def lazy_load_warnings_enabled(target=Session) -> bool:
+    return event.contains(target, "do_orm_execute", _warn_lazy_load)
+
+
+def enable_lazy_load_warnings(target=Session):
+    if not lazy_load_warnings_enabled(target):
+        event.listen(target, "do_orm_execute", _warn_lazy_load)
+
+
+def disable_lazy_load_warnings(target=Session):
+    if lazy_load_warnings_enabled(target):
+        event.remove(target, "do_orm_execute", _warn_lazy_load)
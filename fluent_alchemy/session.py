@@ -1,19 +1,66 @@
-from typing import Optional
-from sqlalchemy import Engine
+import threading
+import weakref
+
+from typing import Optional, Union
+from sqlalchemy import Engine, Connection
 from sqlalchemy.orm import sessionmaker, scoped_session
 
 
 class ScopedSessionHandler:
     _session: Optional[scoped_session] = None
 
+    # scoped sessions keyed by id() of their bind, shared by all handlers;
+    # an entry goes away once no handler references its scoped session
+    _sessions: "weakref.WeakValueDictionary[int, scoped_session]" = (
+        weakref.WeakValueDictionary()
+    )
+
+    _lock = threading.Lock()
+
     @classmethod
-    def make_session(cls, engine: Engine):
-        if not isinstance(engine, Engine):
-            raise ValueError("Only support Sqlalchemy Engine Object")
+    def make_session(cls, engine: Union[Engine, Connection], **options):
+        if not isinstance(engine, (Engine, Connection)):
+            raise ValueError("Only support Sqlalchemy Engine or Connection Object")
+
+        factory = sessionmaker(engine, **options)
 
-        cls._session = scoped_session(sessionmaker(engine))
+        with cls._lock:
+            session = cls._sessions.get(id(engine))
+
+            if session is None:
+                session = scoped_session(factory)
+                cls._sessions[id(engine)] = session
+
+            elif session.session_factory.kw != factory.kw:
+                raise ValueError(
+                    "Session of this engine is already made with other options"
+                )
+
+            cls._session = session
 
     @classmethod
     def teardown_session(cls):
         if cls._session:
             cls._session.remove()
+
+    @classmethod
+    def release_session(cls, engine: Union[Engine, Connection]):
+        with cls._lock:
+            session = cls._sessions.pop(id(engine), None)
+
+        if session is None:
+            return
+
+        session.remove()
+
+        if cls._session is session:
+            cls._session = None
+
+    @classmethod
+    def dispose_sessions(cls):
+        with cls._lock:
+            for session in list(cls._sessions.values()):
+                session.remove()
+
+            cls._sessions.clear()
+            cls._session = None
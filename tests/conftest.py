@@ -1,11 +1,19 @@
 import os
 import pytest
 
+from collections import deque
+from typing import Deque, List
+
 from faker import Faker
 from pytest_mock import MockerFixture
-from sqlalchemy import create_engine, Engine
+from sqlalchemy import create_engine, event, insert, Engine, Connection
 from sqlalchemy.orm import sessionmaker, Session
-from tests.models import Model
+from sqlalchemy.pool import StaticPool
+from fluent_alchemy.profiling import enable_lazy_load_warnings
+from tests.models import Model, User
+
+EMAIL_POOL_SIZE = 256
+SEEDED_USERS = 50
 
 
 @pytest.fixture
@@ -13,47 +21,130 @@ def mocker(mocker: MockerFixture) -> MockerFixture:
     return mocker
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def faker() -> Faker:
     return Faker()
 
 
 @pytest.fixture(scope="session")
-def engine() -> Engine:
-    return create_engine("sqlite:///:memory:")
+def email_pool(faker) -> Deque[str]:
+    return deque(faker.unique.email() for _ in range(EMAIL_POOL_SIZE))
 
 
-@pytest.fixture
-def session(engine) -> Session:
-    return sessionmaker(engine)()
-
-
-@pytest.fixture(autouse=True)
-def _test_session(engine):
+@pytest.fixture(scope="session")
+def engine() -> Engine:
     APP_DEBUG: bool = (
         True if os.getenv("APP_DEBUG", "false").lower() == "true" else False
     )
 
-    engine.echo = APP_DEBUG
+    # every pytest-xdist worker is its own process with its own in-memory DB
+    engine = create_engine(
+        "sqlite://",
+        echo=APP_DEBUG,
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
+        query_cache_size=1200,
+    )
+
+    if APP_DEBUG:
+        enable_lazy_load_warnings()
+
+    # compiled statement cache is silently skipped for dialects without opt-in
+    assert engine.dialect.supports_statement_cache
+
+    # let SQLAlchemy emit BEGIN itself, pysqlite does not handle SAVEPOINT well
+    @event.listens_for(engine, "connect")
+    def _disable_pysqlite_transaction(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    # throwaway test database, trade durability for less per-write bookkeeping
+    @event.listens_for(engine, "connect")
+    def _fast_sqlite(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.executescript(
+            "PRAGMA journal_mode=MEMORY;"
+            "PRAGMA synchronous=OFF;"
+            "PRAGMA temp_store=MEMORY;"
+            "PRAGMA locking_mode=EXCLUSIVE;"
+        )
+        cursor.close()
 
+    @event.listens_for(engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+    return engine
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _test_schema(engine):
     Model.metadata.create_all(engine)
-    Model.make_session(engine)
 
-    # yield, to let all tests within the scope run
     yield
 
-    Model.teardown_session()
     Model.metadata.drop_all(engine)
 
 
+@pytest.fixture
+def connection(engine) -> Connection:
+    with engine.connect() as conn:
+        trans = conn.begin()
+
+        yield conn
+
+        if trans.is_active:
+            trans.rollback()
+
+
+@pytest.fixture
+def session(connection) -> Session:
+    return sessionmaker(connection, join_transaction_mode="create_savepoint")()
+
+
+@pytest.fixture(autouse=True)
+def _test_session(connection):
+    # every commit inside a test only releases a SAVEPOINT,
+    # the outer transaction is rolled back after the test
+    Model.make_session(connection, join_transaction_mode="create_savepoint")
+
+    # yield, to let all tests within the scope run
+    yield
+
+    Model.release_session(connection)
+
+
+@pytest.fixture(scope="module")
+def seeded_user_rows(faker) -> List[dict]:
+    return [
+        {
+            "name": faker.name(),
+            "email": faker.unique.email(),
+            "password": faker.password(),
+            "state": True if i % 2 else False,
+        }
+        for i in range(SEEDED_USERS)
+    ]
+
+
+@pytest.fixture
+def seeded_users(seeded_user_rows) -> List[dict]:
+    # rows are generated once per module, inserted inside each test transaction
+    Model._session.execute(insert(User), seeded_user_rows)
+
+    return seeded_user_rows
+
+
 @pytest.fixture
 def name(faker):
     return faker.name()
 
 
 @pytest.fixture
-def email(faker):
-    return faker.email()
+def email(faker, email_pool):
+    if not email_pool:
+        email_pool.extend(faker.unique.email() for _ in range(EMAIL_POOL_SIZE))
+
+    return email_pool.popleft()
 
 
 # @pytest.fixture(scope="session", autouse=True)
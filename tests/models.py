@@ -6,14 +6,30 @@ from fluent_alchemy import ActiveRecord, TimestampMixin
 
 
 class Model(DeclarativeBase, ActiveRecord):
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        # drop misspelled / non column attrs once, at class definition time
+        column_keys = (
+            frozenset(cls.__mapper__.columns.keys())
+            if hasattr(cls, "__mapper__")
+            else frozenset()
+        )
+        attrs = tuple(
+            attr for attr in getattr(cls, "__repr_attrs__", ()) if attr in column_keys
+        )
+        cls.__repr_attrs__ = attrs
+
+        cls._repr_template = (
+            f"{cls.__name__}(" + ", ".join(f"{attr}={{}}" for attr in attrs) + ")"
+        )
+
     def __repr__(self) -> str:
         """Returns representation of the object"""
 
-        return "{name}({attrs})".format(
-            name=self.__class__.__name__,
-            attrs=", ".join(
-                f"{attr}={getattr(self, attr)}" for attr in self.__repr_attrs__
-            ),
+        # read loaded state only, expired or deferred attributes never hit the DB
+        return self._repr_template.format(
+            *(self.__dict__.get(attr, "<unloaded>") for attr in self.__repr_attrs__)
         )
 
 
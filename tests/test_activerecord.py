@@ -1,11 +1,20 @@
 import math
+import pytest
 
 from typing import Sequence
-from sqlalchemy import select, insert, inspect
-from sqlalchemy.orm import Session
+from sqlalchemy import event, func, select, insert, inspect
+from sqlalchemy.orm import (
+    DeclarativeBase,
+    Mapped,
+    Session,
+    mapped_column,
+    relationship,
+)
 from sqlalchemy.engine.row import Row
 from sqlalchemy.engine.cursor import CursorResult
 
+from fluent_alchemy import ActiveRecord
+
 from .models import User, Project
 
 
@@ -22,6 +31,91 @@ def test_create(faker, email: str, name: str, session: Session):
         assert isinstance(u, User)
 
 
+def test_create_with_insert_returning(faker, email: str, name: str, connection):
+    statements = []
+
+    @event.listens_for(connection, "before_cursor_execute")
+    def _record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    user = User.create(email=email, name=name, password=faker.password())
+
+    # attributes come back with the INSERT, reading them needs no extra query
+    assert user.id is not None
+    assert user.email == email
+    assert user.state is True
+    assert user.created_at is not None
+
+    event.remove(connection, "before_cursor_execute", _record)
+
+    inserts = [stmt for stmt in statements if stmt.startswith("INSERT")]
+    assert len(inserts) == 1
+    assert "RETURNING" in inserts[0]
+    assert not [stmt for stmt in statements if stmt.startswith("SELECT")]
+
+
+def test_create_with_insert_listener(faker, email: str, name: str):
+    inserted = []
+
+    def _before_insert(mapper, connection, target):
+        inserted.append(target)
+
+    event.listen(User, "before_insert", _before_insert)
+
+    try:
+        user = User.create(email=email, name=name, password=faker.password())
+    finally:
+        event.remove(User, "before_insert", _before_insert)
+
+    # falls back to save(), so mapper events still fire
+    assert inserted == [user]
+    assert user.email == email
+
+
+def test_create_with_custom_init(connection):
+    class Base(DeclarativeBase, ActiveRecord):
+        pass
+
+    class Account(Base):
+        __tablename__ = "accounts"
+
+        id: Mapped[int] = mapped_column(primary_key=True)
+        pw: Mapped[str] = mapped_column()
+
+        def __init__(self, **kwargs):
+            if "pw" in kwargs:
+                kwargs["pw"] = f"hashed:{kwargs['pw']}"
+
+            super().__init__(**kwargs)
+
+    Base.metadata.create_all(connection)
+    Base.make_session(connection, join_transaction_mode="create_savepoint")
+
+    # falls back to save(), so the constructor still runs
+    account = Account.create(pw="secret")
+
+    assert account.pw == "hashed:secret"
+    assert Account.find(account.id).pw == "hashed:secret"
+
+    Base.registry.dispose()
+
+
+def test_create_with_init_listener(faker, email: str, name: str):
+    initialized = []
+
+    def _init(target, args, kwargs):
+        initialized.append(kwargs["email"])
+
+    event.listen(User, "init", _init)
+
+    try:
+        User.create(email=email, name=name, password=faker.password())
+    finally:
+        event.remove(User, "init", _init)
+
+    assert initialized == [email]
+
+
 def test_save(faker, email: str, name: str, session: Session):
     user = User(email=email, name=name, password=faker.password())
 
@@ -146,6 +240,21 @@ def test_paginate(faker, session: Session):
         isinstance(user, User)
 
 
+def test_commit_rolled_back_after_test(
+    faker, email: str, name: str, engine, connection
+):
+    User.create(email=email, name=name, password=faker.password())
+
+    assert len(User.all()) == 1
+
+    # what the connection fixture does after every test
+    connection.get_transaction().rollback()
+
+    # commits only released the per-test SAVEPOINT, nothing reached the database
+    with engine.connect() as conn:
+        assert conn.scalar(select(func.count()).select_from(User)) == 0
+
+
 def test_insert_single(faker):
     values = {
         "name": faker.name(),
@@ -300,3 +409,33 @@ def test_where_delete(faker, name: str, email: str):
 
 #     trashed = Order.where(Order.uuid == uid).first(with_trashed=True)
 #     assert trashed is None
+
+
+def test_repr_does_not_load_expired_attributes(faker, email: str, name: str):
+    user = User.create(email=email, name=name, password=faker.password())
+
+    User._session.expire(user)
+
+    assert repr(user) == (
+        "User(id=<unloaded>, email=<unloaded>, name=<unloaded>, state=<unloaded>)"
+    )
+    assert "email" not in user.__dict__
+
+
+def test_column_keys_without_configured_mappers():
+    class Base(DeclarativeBase, ActiveRecord):
+        pass
+
+    class Account(Base):
+        __tablename__ = "accounts"
+
+        id: Mapped[int] = mapped_column(primary_key=True)
+        email: Mapped[str] = mapped_column("email_address")
+
+        # unresolvable until configure, the keys must not depend on it
+        owner: Mapped["Owner"] = relationship()  # noqa: F821
+
+    assert Account.__all_column_keys__ == {"id", "email"}
+    assert Account.__column_names__ == {"id", "email_address"}
+
+    Base.registry.dispose()
@@ -42,6 +42,26 @@ def test_set_values(faker, builder: InsertBuilder):
         assert values[column.name] == param.value
 
 
+def test_set_values_multiple(faker, builder: InsertBuilder):
+    values = [
+        {
+            "name": faker.name(),
+            "email": faker.email(),
+            "password": faker.password(),
+        }
+        for _ in range(3)
+    ]
+
+    builder.values(values).insert()
+
+    # rows are sent as executemany parameters, not rendered into the statement
+    stmt = builder._insert_stmt
+    builder._session.execute.assert_called_once_with(stmt, values)
+
+    assert not stmt._values
+    assert not stmt._multi_values
+
+
 def test_set_returning_all(faker, builder: InsertBuilder):
     values = {
         "name": faker.name(),
@@ -134,3 +154,20 @@ def test_insert_single(faker, session: Session):
         assert user.name == values["name"]
         assert user.email == values["email"]
         assert user.password == values["password"]
+
+
+def test_insert_tuple_rows(faker, session: Session):
+    rows = [
+        (idx, faker.email(), faker.password(), faker.name(), True, None, None)
+        for idx in range(1, 4)
+    ]
+
+    # positional rows are rendered as a multi VALUES clause
+    InsertBuilder(session, User()).values(rows).insert()
+
+    with session() as db:
+        users = db.scalars(select(User).order_by(User.id)).all()
+
+        assert [(user.id, user.email, user.name) for user in users] == [
+            (row[0], row[1], row[3]) for row in rows
+        ]
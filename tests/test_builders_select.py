@@ -1,12 +1,13 @@
 import math
 import pytest
 
-from sqlalchemy import inspect, insert
+from sqlalchemy import event, insert
 from sqlalchemy.engine.row import Row
-from sqlalchemy.orm import scoped_session, joinedload
+from sqlalchemy.orm import Session, scoped_session, joinedload
 from sqlalchemy.orm.strategy_options import Load
 from sqlalchemy.sql.elements import (
     BinaryExpression,
+    BindParameter,
     UnaryExpression,
     Label,
     _textual_label_reference,
@@ -30,18 +31,20 @@ def builder(session) -> SelectBuilder:
     return SelectBuilder(session, User())
 
 
-def test_select_initial(builder: SelectBuilder):
+def test_select_initial(builder: SelectBuilder, session: scoped_session):
     assert isinstance(builder._model, User)
     assert builder.get_model_class() is User
 
+    # scoped session is resolved to the thread-local Session once
+    assert isinstance(builder._session, Session)
+    assert builder._session is session()
 
-def test_select_all_fields(builder: SelectBuilder):
-    columns = {col.name for col in inspect(User).columns}
 
+def test_select_all_fields(builder: SelectBuilder):
     stmt = builder.select(User)._select_stmt
 
     assert stmt.is_select
-    assert set(stmt.selected_columns.keys()) == columns
+    assert set(stmt.selected_columns.keys()) == User.__column_names__
 
 
 def test_select_specific_fields(builder: SelectBuilder):
@@ -76,6 +79,52 @@ def test_select_where_clauses(faker, builder: SelectBuilder):
         assert param.value == validate[idx]["value"]
 
 
+def test_select_where_eq(faker, session: scoped_session):
+    name = faker.name()
+    email = faker.email()
+
+    builder = SelectBuilder(session, User()).where_eq(User.name, name)
+    builder.where_eq(User.email, email)
+
+    validate = [
+        {"field": "name", "value": name},
+        {"field": "email", "value": email},
+    ]
+
+    assert len(builder._where_clauses) == len(validate)
+
+    for idx, clause in enumerate(builder._where_clauses):
+        assert isinstance(clause, BinaryExpression)
+        assert isinstance(clause.right, BindParameter)
+
+        assert clause.left.name == validate[idx]["field"]
+        assert clause.right.value == validate[idx]["value"]
+
+    other = (
+        SelectBuilder(session, User())
+        .where_eq(User.name, faker.name())
+        .where_eq(User.email, faker.email())
+    )
+
+    assert (
+        builder._build_stmt()._generate_cache_key()
+        == other._build_stmt()._generate_cache_key()
+    )
+
+
+def test_select_stmt_cache_key(faker, session: scoped_session):
+    stmts = [
+        SelectBuilder(session, User())
+        .where(User.email == faker.email())
+        .limit(faker.pyint())
+        ._build_stmt()
+        for _ in range(2)
+    ]
+
+    # literal values are bound parameters, all shapes share one compiled SQL
+    assert stmts[0]._generate_cache_key() == stmts[1]._generate_cache_key()
+
+
 def test_select_offset_clause(faker, builder: SelectBuilder):
     offset = faker.pyint()
 
@@ -152,6 +201,17 @@ def test_select_options_clause(builder: SelectBuilder):
         assert isinstance(opt, Load)
 
 
+def test_select_with_relations(session: scoped_session):
+    stmt = SelectBuilder(session, User()).with_relations("orders")._select_stmt
+
+    for opt in stmt._with_options:
+        assert isinstance(opt, Load)
+
+    stmt = SelectBuilder(session, User()).with_relations(User.orders)._select_stmt
+
+    assert len(stmt._with_options) == 1
+
+
 def test_select_joined_load_unique(faker, session: scoped_session):
     session.execute(
         insert(User).values(
@@ -247,25 +307,31 @@ def test_select_get(faker, session: scoped_session):
             user.id
 
 
-def test_select_paginate(faker, session: scoped_session):
-    total = 50
-    page = 2
-    per_page = 15
+def test_select_get_stream(seeded_users, session: scoped_session, mocker):
+    mocker.patch.object(SelectBuilder, "_stream_batch_size", 20)
 
-    session.execute(
-        insert(User).values(
-            [
-                {
-                    "name": faker.name(),
-                    "email": faker.email(),
-                    "password": faker.password(),
-                    "state": True if i % 2 else False,
-                }
-                for i in range(total)
-            ]
-        )
+    partitions = list(SelectBuilder(session, User()).select().get(stream=True))
+
+    assert [len(partition) for partition in partitions] == [20, 20, 10]
+    for user in partitions[0]:
+        assert isinstance(user, User)
+
+    # specific fields
+    partitions = list(
+        SelectBuilder(session, User())
+        .select(User.name, User.email)
+        .get(specific_fields=True, stream=True)
     )
-    session.commit()
+
+    assert sum(len(partition) for partition in partitions) == len(seeded_users)
+    for user in partitions[0]:
+        assert isinstance(user, Row)
+
+
+def test_select_paginate(seeded_users, session: scoped_session):
+    total = len(seeded_users)
+    page = 2
+    per_page = 15
 
     paginate = SelectBuilder(session, User()).select().paginate(page, per_page)
 
@@ -279,25 +345,10 @@ def test_select_paginate(faker, session: scoped_session):
         assert isinstance(user, User)
 
 
-def test_select_paginate_with_where_clauses(faker, session: scoped_session):
+def test_select_paginate_with_where_clauses(seeded_users, session: scoped_session):
     page = 2
     per_page = 15
 
-    session.execute(
-        insert(User).values(
-            [
-                {
-                    "name": faker.name(),
-                    "email": faker.email(),
-                    "password": faker.password(),
-                    "state": True if i % 2 else False,
-                }
-                for i in range(50)
-            ]
-        )
-    )
-    session.commit()
-
     users = SelectBuilder(session, User()).where(User.state.is_(True)).get()
     total = len(users)
 
@@ -315,3 +366,70 @@ def test_select_paginate_with_where_clauses(faker, session: scoped_session):
 
     for user in paginate["data"]:
         assert isinstance(user, User)
+
+
+def test_select_paginate_out_of_range(faker, session: scoped_session):
+    total = 10
+    per_page = 15
+
+    session.execute(
+        insert(User).values(
+            [
+                {
+                    "name": faker.name(),
+                    "email": faker.email(),
+                    "password": faker.password(),
+                }
+                for _ in range(total)
+            ]
+        )
+    )
+    session.commit()
+
+    paginate = SelectBuilder(session, User()).paginate(2, per_page)
+
+    assert paginate["total"] == total
+    assert paginate["last_page"] == 1
+    assert paginate["data"] == []
+
+
+@pytest.fixture
+def statements(connection) -> list:
+    recorded = []
+
+    def _record(conn, cursor, statement, *args):
+        recorded.append(statement)
+
+    event.listen(connection, "before_cursor_execute", _record)
+
+    yield recorded
+
+    event.remove(connection, "before_cursor_execute", _record)
+
+
+def test_select_paginate_single_query(
+    seeded_users, statements, session: scoped_session
+):
+    paginate = SelectBuilder(session, User()).paginate(1, 15)
+
+    assert paginate["total"] == len(seeded_users)
+    assert len(paginate["data"]) == 15
+
+    # total comes back with the page through COUNT(*) OVER ()
+    selects = [stmt for stmt in statements if stmt.startswith("SELECT")]
+    assert len(selects) == 1
+    assert "OVER ()" in selects[0]
+
+
+def test_select_paginate_distinct(
+    seeded_users, statements, session: scoped_session
+):
+    paginate = SelectBuilder(session, User()).distinct().paginate(1, 15)
+
+    assert paginate["total"] == len(seeded_users)
+    assert len(paginate["data"]) == 15
+
+    # window function does not apply to DISTINCT, falls back to a COUNT query
+    selects = [stmt for stmt in statements if stmt.startswith("SELECT")]
+    assert len(selects) == 2
+    assert not any("OVER ()" in stmt for stmt in selects)
@@ -0,0 +1,94 @@
+import os
+import pytest
+import traceback
+
+from sqlalchemy import insert
+from sqlalchemy.orm import scoped_session
+
+from fluent_alchemy import profiling
+from fluent_alchemy.profiling import (
+    LazyLoadWarning,
+    enable_lazy_load_warnings,
+    disable_lazy_load_warnings,
+    lazy_load_warnings_enabled,
+)
+
+from .models import Model, User
+
+
+@pytest.fixture
+def session() -> scoped_session:
+    return Model._session
+
+
+@pytest.fixture(autouse=True)
+def _lazy_load_warnings():
+    # conftest may have enabled the warnings session-wide (APP_DEBUG)
+    enabled = lazy_load_warnings_enabled()
+
+    enable_lazy_load_warnings()
+
+    yield
+
+    if not enabled:
+        disable_lazy_load_warnings()
+
+
+@pytest.fixture
+def users(faker, session: scoped_session):
+    session.execute(
+        insert(User).values(
+            [
+                {
+                    "name": faker.name(),
+                    "email": faker.email(),
+                    "password": faker.password(),
+                }
+                for _ in range(3)
+            ]
+        )
+    )
+    session.commit()
+
+
+def test_warn_on_lazy_load(users):
+    with pytest.warns(LazyLoadWarning, match="User.orders") as record:
+        for user in User.all():
+            user.orders
+
+    assert len(record) == 3
+    assert record[0].filename == __file__
+
+
+def test_no_warning_with_relations(users, recwarn):
+    for user in User.with_relations("orders").get():
+        assert user.orders == []
+
+    assert not [w for w in recwarn if issubclass(w.category, LazyLoadWarning)]
+
+
+def test_warn_without_caller_frame(users, mocker):
+    mocker.patch.object(profiling, "_caller_frame", return_value=None)
+
+    with pytest.warns(LazyLoadWarning, match="User.orders"):
+        for user in User.all():
+            user.orders
+
+
+def test_caller_frame_skips_only_internal_packages(mocker):
+    sibling = profiling._INTERNALS[0].rstrip(os.sep) + "_utils"
+
+    mocker.patch.object(
+        profiling.traceback,
+        "extract_stack",
+        return_value=[
+            traceback.FrameSummary(os.path.join(sibling, "types.py"), 1, "f"),
+            traceback.FrameSummary(
+                os.path.join(profiling._INTERNALS[0], "orm", "loading.py"), 2, "g"
+            ),
+        ],
+    )
+
+    frame = profiling._caller_frame()
+
+    assert frame.filename == os.path.join(sibling, "types.py")
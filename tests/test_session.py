@@ -0,0 +1,74 @@
+import gc
+import pytest
+import weakref
+
+from sqlalchemy import create_engine
+
+from .models import Model, User
+
+
+@pytest.fixture
+def other_engine():
+    return create_engine("sqlite://")
+
+
+def test_make_session_reuses_scoped_session(other_engine):
+    Model.make_session(other_engine)
+    session = Model._session
+
+    Model.make_session(other_engine)
+
+    assert Model._session is session
+
+
+def test_make_session_invalid_engine():
+    with pytest.raises(ValueError):
+        Model.make_session("sqlite://")
+
+
+def test_make_session_with_other_options(other_engine):
+    Model.make_session(other_engine)
+
+    with pytest.raises(ValueError):
+        Model.make_session(other_engine, expire_on_commit=False)
+
+
+def test_teardown_session(faker, other_engine):
+    Model.metadata.create_all(other_engine)
+    Model.make_session(other_engine)
+    session = Model._session
+
+    User.create(email=faker.email(), name=faker.name(), password=faker.password())
+
+    Model.teardown_session()
+
+    # only the current Session is closed, the scoped session stays usable
+    assert Model._session is session
+    assert not session.registry.has()
+    assert len(User.all()) == 1
+
+
+def test_dispose_sessions(other_engine):
+    Model.make_session(other_engine)
+
+    Model.dispose_sessions()
+
+    assert Model._session is None
+    assert not Model._sessions
+
+
+def test_release_session():
+    engine = create_engine("sqlite://")
+    ref = weakref.ref(engine)
+
+    Model.make_session(engine)
+    Model.release_session(engine)
+
+    assert Model._session is None
+    assert id(engine) not in Model._sessions
+
+    del engine
+    gc.collect()
+
+    # the registry no longer keeps the bind alive
+    assert ref() is None